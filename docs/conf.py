@@ -6,9 +6,17 @@
 # https://www.sphinx-doc.org/en/master/usage/configuration.html
 
 import os
-import sys
+import pickle
+from pathlib import Path
 
-sys.path.insert(0, os.path.abspath("src"))
+from sphinx.errors import ConfigError
+
+
+# Set `DOCS_DEV=1` for faster local iteration, e.g.
+# `DOCS_DEV=1 sphinx-build -b html . build/html`. This skips the extensions
+# that only polish the final output (tooltips, 404 page and favicons). CI and
+# release builds should leave it unset.
+_docs_dev = bool(os.environ.get("DOCS_DEV"))
 
 
 # -----------------------------------------------------------------------------
@@ -26,28 +34,30 @@ project = "credrails-reconciler"
 # https://www.sphinx-doc.org/en/master/usage/configuration.html#general-configuration
 # -----------------------------------------------------------------------------
 
-extensions = ["sphinx.ext.autodoc", "sphinx.ext.autosummary"]
+# Generate the API reference from the sources without importing them.
+extensions = ["autoapi.extension"]
 
-# Preserve authored syntax for defaults
-autodoc_preserve_defaults = True
+autoapi_add_toctree_entry = False  # Linked to explicitly from the root doc.
 
-autodoc_default_flags = {
-    "inherited-members": True,
-    "show-inheritance": True,
-    "special-members": (
-        "__enter__",
-        "__exit__",
-        "__call__",
-        "__getattr__",
-        "__setattr_",
-    ),
-}
+autoapi_dirs = ["../src/credrails"]
+
+# Keep the generated pages between builds, see `_restore_api_pages_mtimes`.
+autoapi_keep_files = True
+
+autoapi_member_order = "groupwise"
 
-autodoc_member_order = "groupwise"
+autoapi_options = [
+    "imported-members",
+    "members",
+    "show-inheritance",
+    "show-module-summary",
+    "special-members",
+    "undoc-members",
+]
 
 autoapi_python_use_implicit_namespaces = True
 
-autosummary_generate = True  # Turn on sphinx.ext.autosummary
+autoapi_type = "python"
 
 exclude_patterns = []
 
@@ -57,9 +67,14 @@ nitpicky = True
 nitpick_ignore = [
     ("py:attr", "credrails.reconciler.app._config.Config.diff_writer_factory"),  # private attr
     ("py:attr", "credrails.reconciler.app._config.Config.reconciler_factory"),  # private attr
+    ("py:class", "Config.get.T"),  # type parameter
+    ("py:class", "Config.get_or_default.T"),  # type parameter
     ("py:class", "CSVRecord"),  # type annotation only available when type checking
     ("py:class", "CSVRecordDifferFactory"),  # type annotation only available when type checking
+    ("py:class", "DiffWriterFactory"),  # type alias
     ("py:class", "DT"),  # type annotation only available when type checking
+    ("py:class", "load_from_entrypoint.T"),  # type parameter
+    ("py:class", "ReconcilerFactor"),  # type alias
     ("py:class", "ST"),  # type annotation only available when type checking
     ("py:class", "T"),  # type annotation only available when type checking
     ("py:class", "TT"),  # type annotation only available when type checking
@@ -69,12 +84,14 @@ nitpick_ignore = [
     ("py:class", "Reconciler"),  # Used as type annotation. Only available when type checking
     ("py:class", "SupportsWrite"),  # Used as type annotation. Only available when type checking
     ("py:class", "Writer"),  # Used as type annotation. Only available when type checking
+    ("py:class", "_config.DiffWriterFactory"),  # private type alias
+    ("py:class", "_config.ReconcilerFactor"),  # private type alias
     ("py:class", "credrails.reconciler.app._config.Config"),  # private type
+    ("py:obj", "click.Choice"),  # third party type, its inventory isn't loaded
+    ("py:obj", "CSVRecord"),  # type annotation only available when type checking
     ("py:obj", "credrails.reconciler.lib.csv_reconciler.CSVRecord"),  # type annotation only available when type checking
 ]
 
-templates_path = ["_templates"]
-
 root_doc = "index"
 
 
@@ -109,47 +126,37 @@ html_theme_options = {
 
 extensions += ["sphinx.ext.intersphinx"]
 intersphinx_mapping = {
-    "peps": ("https://peps.python.org/", None),
     "python": ("https://docs.python.org/3", None),
-    "pypackage": ("https://packaging.python.org/en/latest/", None),
-    "importlib-resources": (
-        "https://importlib-resources.readthedocs.io/en/latest",
-        None,
-    ),
-    "django": (
-        "http://docs.djangoproject.com/en/dev/",
-        "http://docs.djangoproject.com/en/dev/_objects/",
-    ),
 }
 
+# Reuse fetched inventories for longer between builds
+intersphinx_cache_limit = 90  # days
+
 
 # -----------------------------------------------------------------------------
 # Support tooltips on references
 # -----------------------------------------------------------------------------
 
-extensions += ["hoverxref.extension"]
+if not _docs_dev:
+    extensions += ["hoverxref.extension"]
 hoverxref_auto_ref = True
-hoverxref_intersphinx = [
-    "python",
-    "pip",
-    "pypackage",
-    "importlib-resources",
-    "django",
-]
+hoverxref_intersphinx = ["python"]
 
 
 # -----------------------------------------------------------------------------
 # Add support for nice Not Found 404 pages
 # -----------------------------------------------------------------------------
 
-extensions += ["notfound.extension"]
+if not _docs_dev:
+    extensions += ["notfound.extension"]
 
 
 # -----------------------------------------------------------------------------
 # Add icons (aka "favicons") to documentation
 # -----------------------------------------------------------------------------
 
-extensions += ["sphinx_favicon"]
+if not _docs_dev:
+    extensions += ["sphinx_favicon"]
 html_static_path += ["images"]  # should contain the folder with icons
 
 # List of dicts with <link> HTML attributes
@@ -163,3 +170,67 @@ favicons = [
         "sizes": "any",
     },
 ]
+
+
+# -----------------------------------------------------------------------------
+# Keep all config values picklable
+# -----------------------------------------------------------------------------
+# Sphinx pickles the config together with the build environment, and values
+# that can't be pickled force a full rebuild on the next run. Only use plain
+# values (strings, numbers, tuples, lists and dicts) in this file and refer to
+# callables by their dotted path, e.g. "natsort.natsorted", not the object.
+
+
+def _check_config_is_picklable(app, config):
+    for name in config.values:
+        try:
+            pickle.dumps(getattr(config, name))
+        except Exception as exp:
+            _err_msg = f"Config value '{name}' can't be pickled: {exp!s}."
+            raise ConfigError(_err_msg) from exp
+
+
+# -----------------------------------------------------------------------------
+# Don't let AutoAPI invalidate unchanged API pages
+# -----------------------------------------------------------------------------
+# With `autoapi_keep_files` on, AutoAPI only regenerates its pages when the
+# sources change, but then it rewrites all of them. The new mtimes make Sphinx
+# re-read the whole API reference. Undo that for pages whose contents are
+# unchanged, and drop pages that weren't regenerated, i.e. those of removed
+# modules.
+
+
+def _api_pages(app):
+    api_root = Path(app.srcdir, app.config.autoapi_root)
+    return {
+        page: (page.read_bytes(), page.stat())
+        for page in api_root.rglob(f"*{next(iter(app.config.source_suffix))}")
+    }
+
+
+def _snapshot_api_pages(app):
+    app.env.temp_data["api_pages"] = _api_pages(app)
+
+
+def _restore_api_pages_mtimes(app):
+    before = app.env.temp_data.pop("api_pages")
+    rewritten = {
+        page
+        for page, (_, stat) in before.items()
+        if page.exists() and page.stat().st_mtime_ns != stat.st_mtime_ns
+    }
+    if not rewritten:  # AutoAPI skipped generation, nothing to do
+        return
+
+    for page, (content, stat) in before.items():
+        if page not in rewritten:
+            page.unlink(missing_ok=True)
+        elif page.read_bytes() == content:
+            os.utime(page, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+
+def setup(app):
+    app.connect("config-inited", _check_config_is_picklable)
+    # AutoAPI generates its pages on "builder-inited" at the default priority
+    app.connect("builder-inited", _snapshot_api_pages, priority=400)
+    app.connect("builder-inited", _restore_api_pages_mtimes, priority=600)
@@ -6,11 +6,17 @@ property should be thought of and used as a constant.
 
 The :func:`setup` function is used to change the value of the ``Config`` in
 use. This is only invoked once, early on in the application start up phase.
+
+The factories of the ``Config`` in use are also re-exported as the plain
+:attr:`diff_writer_factory` and :attr:`reconciler_factory` module attributes.
+These are rebound by :func:`setup` and save clients a lookup through
+:attr:`conf` on each use. Like :attr:`conf`, they should always be accessed
+through this module and never imported directly.
 """
 
 from __future__ import annotations
 
-from typing import Final
+from typing import TYPE_CHECKING, Any, Final, Never
 
 from ._config import (
     Config,
@@ -19,14 +25,30 @@ from ._config import (
     NotSetupError,
 )
 
+if TYPE_CHECKING:
+    from ._config import DiffWriterFactory, ReconcilerFactor
+
+
+def _awaiting_setup(*args: Any, **kwargs: Any) -> Never:  # noqa: ANN401
+    raise NotSetupError
+
+
 conf: Final[Config] = Config.of_awaiting_setup()
 """The application configurations in use."""
 
+diff_writer_factory: DiffWriterFactory = _awaiting_setup
+"""The ``DiffWriter`` factory of the application configurations in use."""
+
+reconciler_factory: ReconcilerFactor = _awaiting_setup
+"""The ``Reconciler`` factory of the application configurations in use."""
+
 
 def setup(config: Config) -> None:
     """Prepare the application and ready it for use."""
-    global conf
+    global conf, diff_writer_factory, reconciler_factory
     conf = config  # type: ignore
+    diff_writer_factory = config.diff_writer_factory
+    reconciler_factory = config.reconciler_factory
 
 
 __all__ = [
@@ -35,5 +57,7 @@ __all__ = [
     "NotSetupError",
     "NoSuchSettingError",
     "conf",
+    "diff_writer_factory",
+    "reconciler_factory",
     "setup",
 ]
@@ -2,14 +2,17 @@
 from __future__ import annotations
 
 from abc import ABCMeta, abstractmethod
-from collections.abc import Callable, Iterable, Mapping
-from typing import IO, Any, Never, override
+from typing import TYPE_CHECKING, Final, override
 
-from attrs import field, frozen, validators
-
-from credrails.reconciler.core import DiffWriter, Reconciler, ReconcilerError
+from credrails.reconciler.core import ReconcilerError
 from credrails.reconciler.lib import NoOpDiffWriter, NoOpReconciler
 
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Mapping
+    from typing import IO, Any, Never
+
+    from credrails.reconciler.core import DiffWriter, Reconciler
+
 # =============================================================================
 # TYPES
 # =============================================================================
@@ -181,14 +184,12 @@ class Config(metaclass=ABCMeta):
 # =============================================================================
 
 
-@frozen
 class _NotSetup(Config):
-    _err_msg: str | None = field(
-        alias="err_msg",
-        default=None,
-        repr=False,
-        validator=validators.optional(validators.instance_of(str)),
-    )
+    __slots__ = ("_err_msg",)
+
+    def __init__(self, err_msg: str | None = None) -> None:
+        super().__init__()
+        self._err_msg: str | None = err_msg
 
     @property
     def diff_writer_factory(self) -> DiffWriterFactory:
@@ -211,39 +212,33 @@ class _NotSetup(Config):
         raise NotSetupError(message=err_msg)
 
 
-@frozen
-class _ConfigImp(Config):
-    _diff_writer_factory: DiffWriterFactory = field(
-        alias="diff_writer_factory",
-        repr=False,
-        validator=validators.is_callable(),
-    )
-    _reconciler_factory: ReconcilerFactor = field(
-        alias="reconciler_factory",
-        repr=False,
-        validator=validators.is_callable(),
-    )
-    _config: Mapping[str, Any] = field(
-        alias="config",
-        factory=dict,
-        repr=False,
-    )
+# Marks a missing setting, so that a single dict probe can tell apart a
+# missing setting from one explicitly set to ``None``.
+_SENTINEL: Final[object] = object()
 
-    @property
-    @override
-    def diff_writer_factory(self) -> DiffWriterFactory:
-        return self._diff_writer_factory
 
-    @property
-    @override
-    def reconciler_factory(self) -> ReconcilerFactor:
-        return self._reconciler_factory
+class _ConfigImp(Config):
+    # The factories are plain attributes, not properties, so that reading
+    # them skips the descriptor call.
+    __slots__ = ("_config", "diff_writer_factory", "reconciler_factory")
+
+    def __init__(
+        self,
+        diff_writer_factory: DiffWriterFactory,
+        reconciler_factory: ReconcilerFactor,
+        config: dict[str, Any] | None = None,
+    ) -> None:
+        super().__init__()
+        self.diff_writer_factory: DiffWriterFactory = diff_writer_factory  # pyright: ignore
+        self.reconciler_factory: ReconcilerFactor = reconciler_factory  # pyright: ignore
+        self._config: dict[str, Any] = config if config is not None else {}
 
     @override
     def get[T](self, setting: str) -> T:  # pyright: ignore
-        if setting not in self._config:
+        value: Any = self._config.get(setting, _SENTINEL)
+        if value is _SENTINEL:
             raise NoSuchSettingError(setting=setting)
-        return self._config[setting]
+        return value
 
     @override
     def get_or_default[T](self, setting: str, default: T) -> T:
@@ -2,16 +2,18 @@
 from __future__ import annotations
 
 import sys
-from collections.abc import Callable, Iterable, Mapping
-from typing import IO, Any
+from typing import TYPE_CHECKING
 
 import click
 
-from credrails.reconciler.core import DiffWriter, Reconciler
-
 from . import constants
-from ._utils import list_available_entry_point_names as lep
-from ._utils import load_from_entrypoint
+from ._utils import EntryPointChoice
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Mapping
+    from typing import IO, Any
+
+    from credrails.reconciler.core import DiffWriter, Reconciler
 
 # =============================================================================
 # TYPES
@@ -31,32 +33,46 @@ type ReconcilerFactor = Callable[
 # =============================================================================
 
 
-def _select_primary_diff_writer(
-    cli_option: str,
-    available_diff_writers: Mapping[str, DiffWriterFactory],
-) -> DiffWriterFactory | None:
-    match cli_option:
-        case "auto" if available_diff_writers:
-            # pick the first reconciler loaded.
-            return next(iter(available_diff_writers.values()))
-        case "auto":
-            return None
-        case _:
-            return available_diff_writers[cli_option]
-
-
-def _select_primary_reconciler(
-    cli_option: str,
-    available_reconcilers: Mapping[str, ReconcilerFactor],
-) -> ReconcilerFactor | None:
-    match cli_option:
-        case "auto" if available_reconcilers:
-            # pick the first reconciler loaded.
-            return next(iter(available_reconcilers.values()))
-        case "auto":
-            return None
-        case _:
-            return available_reconcilers[cli_option]
+def _select_primary[T](
+    cli_option: str, available: Mapping[str, T]
+) -> T | None:
+    if cli_option == "auto":
+        # pick the first item loaded.
+        return next(iter(available.values()), None)
+    return available[cli_option]
+
+
+def _open_output(output: str) -> IO[Any]:
+    if output == "-":
+        return _open_stdout()
+    # Give the writers a large buffer to cut down on the write syscalls made
+    # when persisting many diffs.
+    return open(output, mode="w", buffering=constants.OUTPUT_BUFFER_SIZE)  # noqa: SIM115
+
+
+def _open_stdout() -> IO[Any]:
+    try:
+        stdout_fd: int | None = sys.stdout.fileno()
+    except (AttributeError, OSError):
+        stdout_fd = None
+
+    if stdout_fd is None or sys.stdout.isatty():
+        # Leave stdout as is, i.e. line buffered on terminals. This is left
+        # open when the returned file is closed.
+        return click.open_file("-", mode="w")
+
+    # When piped or redirected, write to stdout through a large buffer too.
+    # The returned file shares stdout's file descriptor, and leaves it open
+    # once closed, which flushes whatever is left on the buffer.
+    sys.stdout.flush()
+    return open(  # noqa: SIM115
+        stdout_fd,
+        mode="w",
+        buffering=constants.OUTPUT_BUFFER_SIZE,
+        encoding=sys.stdout.encoding,
+        errors=sys.stdout.errors,
+        closefd=False,
+    )
 
 
 def _set_up_app(
@@ -65,6 +81,9 @@ def _set_up_app(
     try:
         from credrails.reconciler.app import Config, setup
 
+        from . import tui
+        from ._utils import load_from_entrypoint
+
         diff_writers: Mapping[str, DiffWriterFactory] = load_from_entrypoint(
             entrypoint_group_name=constants.DIFF_WRITERS_ENTRY_POINT_GROUP_NAME,
         )
@@ -72,15 +91,13 @@ def _set_up_app(
             entrypoint_group_name=constants.RECONCILERS_ENTRY_POINT_GROUP_NAME,
         )
 
-        primary_diff_writer: DiffWriterFactory | None
-        primary_diff_writer = _select_primary_diff_writer(
+        primary_diff_writer: DiffWriterFactory | None = _select_primary(
             cli_option=writer,
-            available_diff_writers=diff_writers,
+            available=diff_writers,
         )
-        primary_reconciler: ReconcilerFactor | None
-        primary_reconciler = _select_primary_reconciler(
+        primary_reconciler: ReconcilerFactor | None = _select_primary(
             cli_option=reconciler,
-            available_reconcilers=reconcilers,
+            available=reconcilers,
         )
 
         config: dict[str, Any] = {
@@ -89,13 +106,13 @@ def _set_up_app(
             constants.APP_STDOUT_TOGGLE_CONFIG_KEY: not quiet,
             constants.APP_VERBOSITY_CONFIG_KEY: verbosity,
         }
-        setup(
-            Config.of(
-                diff_writer_factory=primary_diff_writer,
-                reconciler_factory=primary_reconciler,
-                config=config,
-            )
+        app_config: Config = Config.of(
+            diff_writer_factory=primary_diff_writer,
+            reconciler_factory=primary_reconciler,
+            config=config,
         )
+        setup(app_config)
+        tui.setup(app_config)
     except Exception as exp:  # noqa: BLE001
         _err_msg: str = (
             "Error setting up the application. The cause of the error was: "
@@ -120,8 +137,8 @@ def _set_up_app(
         "the first reconciler loaded will be used."
     ),
     show_default=True,
-    type=click.Choice(
-        choices=("auto", *lep(constants.RECONCILERS_ENTRY_POINT_GROUP_NAME)),
+    type=EntryPointChoice(
+        constants.RECONCILERS_ENTRY_POINT_GROUP_NAME, "auto"
     ),
 )
 @click.option(
@@ -133,8 +150,8 @@ def _set_up_app(
         "the first diff-writer loaded will be used."
     ),
     show_default=True,
-    type=click.Choice(
-        choices=("auto", *lep(constants.DIFF_WRITERS_ENTRY_POINT_GROUP_NAME)),
+    type=EntryPointChoice(
+        constants.DIFF_WRITERS_ENTRY_POINT_GROUP_NAME, "auto"
     ),
 )
 @click.option(
@@ -147,7 +164,15 @@ def _set_up_app(
         "persisted. Defaults to using '-' (stdout) when not given."
     ),
     show_default=True,
-    type=click.File(mode="w"),
+    type=click.Path(
+        allow_dash=True,
+        dir_okay=False,
+        executable=False,
+        file_okay=True,
+        readable=False,
+        resolve_path=False,
+        writable=True,
+    ),
 )
 @click.option(
     "-q",
@@ -201,7 +226,7 @@ def _set_up_app(
 def main(
     reconciler: str,
     writer: str,
-    output: IO[Any],
+    output: str,
     source: str,
     target: str,
     quiet: bool,
@@ -224,8 +249,14 @@ def main(
     try:
         tui.print_info("Starting ...")
 
-        with open(source) as source_file, open(target) as target_file:
-            usecases.run(source_file, target_file, output)
+        # Read the datasets from disk in large chunks instead of the default
+        # block sized (usually 8 KiB) reads.
+        with (
+            open(source, buffering=constants.INPUT_BUFFER_SIZE) as source_file,
+            open(target, buffering=constants.INPUT_BUFFER_SIZE) as target_file,
+            _open_output(output) as output_file,
+        ):
+            usecases.run(source_file, target_file, output_file)
 
         tui.print_success("Done ;)")
     except Exception as exp:  # noqa: BLE001
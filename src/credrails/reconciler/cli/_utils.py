@@ -1,22 +1,66 @@
 from __future__ import annotations
 
+from functools import cache
+from operator import attrgetter
 from typing import TYPE_CHECKING
 
-from importlib_metadata import entry_points
+import click
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable, Mapping
+    from collections.abc import Iterable, Mapping, Sequence
 
+    from importlib_metadata import EntryPoints
 
+
+@cache
+def _all_entry_points() -> EntryPoints:
+    # Scan the installed distributions' metadata once and share the results
+    # across all the entry point groups looked up by the CLI.
+    from importlib_metadata import entry_points
+
+    return entry_points()
+
+
+@cache
 def list_available_entry_point_names(
     entrypoint_group_name: str,
 ) -> Iterable[str]:
-    _entry_points = entry_points(group=entrypoint_group_name)
-    return tuple(entry_point.name for entry_point in _entry_points)
+    _entry_points = _all_entry_points().select(group=entrypoint_group_name)
+    # `EntryPoints.names` is a set, map instead to keep the discovery order.
+    return tuple(map(attrgetter("name"), _entry_points))
 
 
+@cache
 def load_from_entrypoint[T](entrypoint_group_name: str) -> Mapping[str, T]:  # pyright: ignore
-    _entry_points = entry_points(group=entrypoint_group_name)
+    _entry_points = _all_entry_points().select(group=entrypoint_group_name)
     return {
         entry_point.name: entry_point.load() for entry_point in _entry_points
     }
+
+
+class EntryPointChoice(click.Choice):
+    """A ``click.Choice`` of the names of the entry points in a group.
+
+    The names are only looked up once click needs them, i.e. to validate a
+    value or to render the help text, and not when the command is declared.
+    """
+
+    def __init__(
+        self,
+        entrypoint_group_name: str,
+        *extra_choices: str,
+        case_sensitive: bool = True,
+    ) -> None:
+        self._entrypoint_group_name: str = entrypoint_group_name
+        super().__init__(choices=extra_choices, case_sensitive=case_sensitive)
+
+    @property
+    def choices(self) -> Sequence[str]:
+        return (
+            *self._extra_choices,
+            *list_available_entry_point_names(self._entrypoint_group_name),
+        )
+
+    @choices.setter
+    def choices(self, value: Sequence[str]) -> None:
+        self._extra_choices: tuple[str, ...] = tuple(value)
@@ -18,6 +18,10 @@ DIFF_WRITERS_ENTRY_POINT_GROUP_NAME: Final[
     str
 ] = "credrails.reconciler.cli.diff_writer"
 
+INPUT_BUFFER_SIZE: Final[int] = 1 << 20  # 1 MiB
+
+OUTPUT_BUFFER_SIZE: Final[int] = 1 << 20  # 1 MiB
+
 RECONCILERS_ENTRY_POINT_GROUP_NAME: Final[
     str
 ] = "credrails.reconciler.cli.reconciler"
@@ -3,56 +3,57 @@ from __future__ import annotations
 
 import sys
 import traceback
+from typing import TYPE_CHECKING
 
 import click
 
-from credrails.reconciler import app
 from credrails.reconciler.cli import constants
 
+if TYPE_CHECKING:
+    from credrails.reconciler.app import Config
 
-def print_debug(message: str, nl: bool = True) -> None:
-    if not app.conf.get_or_default(
+# Read from the active config once, on setup, instead of on every print.
+_stdout_enabled: bool = True
+_verbosity: int = 0
+
+
+def setup(config: Config) -> None:
+    global _stdout_enabled, _verbosity
+    _stdout_enabled = config.get_or_default(
         setting=constants.APP_STDOUT_TOGGLE_CONFIG_KEY,
         default=True,
-    ):
+    )
+    _verbosity = config.get_or_default(
+        setting=constants.APP_VERBOSITY_CONFIG_KEY,
+        default=0,
+    )
+
+
+def print_debug(message: str, nl: bool = True) -> None:
+    if not _stdout_enabled:
         return
     click.secho(message, dim=True, fg="yellow", italic=True, nl=nl)
 
 
 def print_info(message: str) -> None:
-    if not app.conf.get_or_default(
-        setting=constants.APP_STDOUT_TOGGLE_CONFIG_KEY,
-        default=True,
-    ):
+    if not _stdout_enabled:
         return
     click.echo(click.style(message, fg="bright_blue"))
 
 
 def print_error(error_message: str, exception: BaseException | None) -> None:
-    verbosity: int = app.conf.get_or_default(
-        setting=constants.APP_VERBOSITY_CONFIG_KEY,
-        default=0,
-    )
     click.secho(error_message, fg="red", bold=True, file=sys.stderr)
-    match verbosity:
-        case 1 if exception is not None:
-            click.secho(
-                "".join(traceback.format_exception(exception, chain=False)),
-                fg="magenta",
-                file=sys.stderr,
-            )
-        case _ if verbosity > 1 and exception is not None:
-            click.secho(
-                "".join(traceback.format_exception(exception, chain=True)),
-                fg="magenta",
-                file=sys.stderr,
-            )
+    if exception is None or _verbosity < 1:
+        return
+
+    # Write the traceback out as it is formatted instead of joining it first.
+    tb = traceback.TracebackException.from_exception(exception, compact=True)
+    for line in tb.format(chain=_verbosity > 1):
+        click.secho(line, fg="magenta", file=sys.stderr, nl=False)
+    click.echo(file=sys.stderr)
 
 
 def print_success(message: str) -> None:
-    if not app.conf.get_or_default(
-        setting=constants.APP_STDOUT_TOGGLE_CONFIG_KEY,
-        default=True,
-    ):
+    if not _stdout_enabled:
         return
     click.echo(click.style(message, fg="green"))
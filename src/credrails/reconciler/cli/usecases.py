@@ -17,24 +17,24 @@ def run(
 ) -> None:
     """Run a ``Reconciler`` and write it's output to the given ``writable``.
 
-    Uses the
-    :attr:`~credrails.reconciler.app._config.Config.reconciler_factory` and
-    :attr:`~credrails.reconciler.app._config.Config.diff_writer_factory`
-    properties of the active :attr:`config<credrails.reconciler.app.conf>` to
-    create a :class:`~credrails.reconciler.core.domain.Reconciler` and
+    Uses the :attr:`~credrails.reconciler.app.reconciler_factory` and
+    :attr:`~credrails.reconciler.app.diff_writer_factory` of the active
+    application configuration to create a
+    :class:`~credrails.reconciler.core.domain.Reconciler` and
     :class:`~credrails.reconciler.core.domain.DiffWriter` respectively. The
-    created `Reconciler` is then used t
+    diffs produced by the created ``Reconciler`` are then consumed by the
+    created ``DiffWriter``.
 
-    :param source:
-    :param target:
-    :param writable:
-    :return:
+    :param source: The source dataset to check for differences against.
+    :param target: The target dataset to check for differences.
+    :param writable: An object that can be written to such as a file. This
+        is where the resulting diffs are written to.
 
-    .. _reconciler: credrails.reconciler.core.Reconciler
+    :return: None.
     """
     from credrails.reconciler import app
 
-    reconciler: Reconciler[Any] = app.conf.reconciler_factory(source, target)
-    writer: DiffWriter[Any] = app.conf.diff_writer_factory(writable)
+    reconciler: Reconciler[Any] = app.reconciler_factory(source, target)
+    writer: DiffWriter[Any] = app.diff_writer_factory(writable)
 
     writer.write(reconciler.reconcile())
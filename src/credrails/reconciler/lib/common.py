@@ -1,6 +1,7 @@
 """Common implementations of the domain interfaces."""
 from __future__ import annotations
 
+from collections import deque
 from typing import IO, TYPE_CHECKING, Any, Never, Self, override
 
 import click
@@ -75,9 +76,8 @@ class NoOpDiffWriter(DiffWriter[Any]):
 
     @override
     def write(self, diffs: Iterable[Diff[Any]]) -> None:
-        for _ in diffs:
-            # Do nothing. Discard all received diffs.
-            ...
+        # Do nothing. Discard all received diffs, draining them in C.
+        deque(diffs, maxlen=0)
 
     @classmethod
     def of(cls, writable: IO[Any]) -> Self:
@@ -4,10 +4,13 @@ from __future__ import annotations
 
 import csv
 from abc import ABCMeta, abstractmethod
-from collections.abc import Callable, Iterable, Mapping
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator, Mapping
 from enum import StrEnum
-from itertools import zip_longest
-from typing import TYPE_CHECKING, Any, Self, override
+from functools import partial
+from itertools import chain, islice, zip_longest
+from operator import attrgetter
+from typing import TYPE_CHECKING, Any, Final, Self, override
 
 import attrs
 from attrs import field, frozen, validators
@@ -21,6 +24,9 @@ from credrails.reconciler.core import (
 )
 
 if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+    from _csv import Writer
     from _typeshed import SupportsWrite
 
 # =============================================================================
@@ -33,6 +39,24 @@ type CSVRecord = Mapping[str, Any]
 type CSVRecordDifferFactory = Callable[[], CSVRecordDiffer]
 
 
+# =============================================================================
+# CONSTANTS
+# =============================================================================
+
+
+_RECORD_ID_INDEX: Final[int] = 0
+"""The index of the column holding the identifiers of the CSV records."""
+
+_PARALLEL_CHUNK_SIZE: Final[int] = 10_000
+"""The default number of source records handed to a worker process at once."""
+
+_UNSUPPORTED_DIFF_TYPE_ERR_MSG: Final[str] = (
+    "Only Diff instances of type "
+    "'credrails.reconciler.lib.csv_reconciler:CSVDiff' are allowed by this "
+    "method."
+)
+
+
 # =============================================================================
 # EXCEPTIONS
 # =============================================================================
@@ -87,6 +111,65 @@ class CSVDiffKinds(StrEnum):
     """
 
 
+# Summaries of the expected and found values of each kind of `CSVDiff`. Kinds
+# missing here have empty summaries.
+_EXPECTED_SUMMARIES: Final[Mapping[str, Callable[[CSVDiff], str]]] = {
+    CSVDiffKinds.NOT_IN_TARGET: lambda diff: f"Record: {diff.record_id}",
+    CSVDiffKinds.FIELD_MISMATCH: lambda diff: f"Value: {diff.source_value}",
+}
+
+_FOUND_SUMMARIES: Final[Mapping[str, Callable[[CSVDiff], str]]] = {
+    CSVDiffKinds.EXTRA_TGT_FIELD: lambda diff: f"Column: {diff.field}",
+    CSVDiffKinds.FIELD_MISMATCH: lambda diff: f"Value: {diff.target_value}",
+    CSVDiffKinds.NOT_IN_SOURCE: lambda diff: f"Record: {diff.record_id}",
+}
+
+
+def _sanitize(value: str) -> str:
+    # FIXME: This should probably only be done for specific columns.
+    return value.strip().lower()
+
+
+def _diff_records(
+    csv_record_differ_factory: CSVRecordDifferFactory,
+    records: Iterable[tuple[str, CSVRecord, CSVRecord | None]],
+) -> Iterator[CSVDiff]:
+    csv_record_differ: Differ[CSVRecord, CSVRecord, str]
+    csv_record_differ = csv_record_differ_factory()
+    extra_tgt_fields: tuple[str, ...] | None = None
+    for record_id, src_record, tgt_record in records:
+        if tgt_record is None:
+            yield CSVDiff.of_not_in_target(record_id=record_id)
+            continue
+
+        if extra_tgt_fields is None:
+            # The records from each file all have the fields named on its
+            # header. The extra target fields are thus the same for all pairs.
+            extra_tgt_fields = tuple(
+                column for column in tgt_record if column not in src_record
+            )
+        diffs: Iterable[CSVDiff] = csv_record_differ.compare(
+            source=src_record,
+            target=tgt_record,
+            record_id=record_id,
+            extra_target_fields=extra_tgt_fields,
+        )
+        if diffs:
+            yield from diffs
+
+
+def _take[T](iterator: Iterator[T], n: int) -> list[T]:
+    return list(islice(iterator, n))
+
+
+def _diff_records_chunk(
+    csv_record_differ_factory: CSVRecordDifferFactory,
+    records: list[tuple[str, CSVRecord, CSVRecord | None]],
+) -> list[CSVDiff]:
+    # Runs on the worker processes, return the diffs in one go to the parent.
+    return list(_diff_records(csv_record_differ_factory, records))
+
+
 # =============================================================================
 # CONCRETE IMPLEMENTATIONS
 # =============================================================================
@@ -96,38 +179,20 @@ class CSVDiffKinds(StrEnum):
 class CSVDiff(Diff[str]):
     """:class:`Diff` produced when reconciling CSV datasets/records."""
 
+    # No validators here, these are created once per diff found and the
+    # ``of_*`` factories used to create them already get the right types.
     _kind: CSVDiffKinds = field(alias="kind")
-    _record_id: str = field(
-        alias="record_id",
-        validator=validators.instance_of(str),
-    )
-    _field: str | None = field(
-        alias="field",
-        default=None,
-        validator=validators.optional(validators.instance_of(str)),
-    )
-    _source_value: str | None = field(
-        alias="source_value",
-        default=None,
-        validator=validators.optional(validators.instance_of(str)),
-    )
-    _target_value: str | None = field(
-        alias="target_value",
-        default=None,
-        validator=validators.optional(validators.instance_of(str)),
-    )
+    _record_id: str = field(alias="record_id")
+    _field: str | None = field(alias="field", default=None)
+    _source_value: str | None = field(alias="source_value", default=None)
+    _target_value: str | None = field(alias="target_value", default=None)
 
     @property
     @override
     def expected(self) -> str:
         """A summary of the expected value."""
-        match self._kind:
-            case CSVDiffKinds.NOT_IN_TARGET:
-                return f"Record: {self._record_id}"
-            case CSVDiffKinds.FIELD_MISMATCH:
-                return f"Value: {self._source_value}"
-            case _:
-                return ""
+        summarize = _EXPECTED_SUMMARIES.get(self._kind)
+        return summarize(self) if summarize is not None else ""
 
     @property
     def field(self) -> str | None:
@@ -138,15 +203,8 @@ class CSVDiff(Diff[str]):
     @override
     def found(self) -> Any:
         """A summary of what the actual value in the target was."""
-        match self._kind:
-            case CSVDiffKinds.EXTRA_TGT_FIELD:
-                return f"Column: {self.field}"
-            case CSVDiffKinds.FIELD_MISMATCH:
-                return f"Value: {self._target_value}"
-            case CSVDiffKinds.NOT_IN_SOURCE:
-                return f"Record: {self._record_id}"
-            case _:
-                return ""
+        summarize = _FOUND_SUMMARIES.get(self._kind)
+        return summarize(self) if summarize is not None else ""
 
     @property
     @override
@@ -255,6 +313,17 @@ class CSVDiff(Diff[str]):
         return cls(kind=CSVDiffKinds.NOT_IN_TARGET, record_id=record_id)
 
 
+# The names of the `CSVDiff` fields, and a getter of their values as a row.
+# These are static, so compute them once instead of on each writer created.
+_CSVDIFF_FIELDS: Final[tuple[str, ...]] = tuple(
+    attribute.name for attribute in attrs.fields(CSVDiff)
+)
+
+_csv_diff_to_row: Final[Callable[[CSVDiff], tuple[Any, ...]]] = attrgetter(
+    *_CSVDIFF_FIELDS
+)
+
+
 @frozen
 class CSVDiffWriter(DiffWriter[str]):
     """:class:`Writer` that consumes :class:`CSV Diffs<CSVDiff>`.
@@ -263,29 +332,22 @@ class CSVDiffWriter(DiffWriter[str]):
     """
 
     _writable: SupportsWrite = field(alias="writable", repr=False)
-    _csv_writer: csv.DictWriter = field(init=False, repr=False)
+    _csv_writer: Writer = field(init=False, repr=False)
 
     def __attrs_post_init__(self) -> None:
-        csv_writer = csv.DictWriter(
-            f=self._writable,
-            fieldnames=tuple(
-                attribute.name for attribute in attrs.fields(CSVDiff)
-            ),
-        )
-        object.__setattr__(self, "_csv_writer", csv_writer)
-        self._csv_writer.writeheader()
+        # Read the fields of each diff straight into a row, instead of going
+        # through `attrs.asdict` and a `csv.DictWriter`.
+        object.__setattr__(self, "_csv_writer", csv.writer(self._writable))
+        self._csv_writer.writerow(_CSVDIFF_FIELDS)
 
     @override
     def write(self, diffs: Iterable[Diff[str]]) -> None:
         for diff in diffs:
-            if not isinstance(diff, CSVDiff):
-                _err_msg: str = (
-                    "Only Diff instances of type"
-                    "'credrails.reconciler.lib.csv_reconciler:CSVDiff' are "
-                    "allowed by this method."
-                )
-                raise UnsupportedDiffTypeError(_err_msg)
-            self._csv_writer.writerow(attrs.asdict(diff))
+            # Check the exact type first, it is cheaper than `isinstance` and
+            # matches all diffs except those of `CSVDiff` subclasses.
+            if type(diff) is not CSVDiff and not isinstance(diff, CSVDiff):
+                raise UnsupportedDiffTypeError(_UNSUPPORTED_DIFF_TYPE_ERR_MSG)
+            self._csv_writer.writerow(_csv_diff_to_row(diff))
 
 
 class CSVRecordDiffer(Differ[CSVRecord, CSVRecord, str], metaclass=ABCMeta):
@@ -320,7 +382,10 @@ class SimpleCSVRecordDiffer(CSVRecordDiffer):
       converted to lower case before being checked for any differences.
 
     This ``Differ`` does also support checking for extra columns on the target
-    record.
+    record. When comparing many records with the same fields, the names of the
+    extra target columns can be computed once and passed to :meth:`compare`
+    using the ``extra_target_fields`` keyword argument. Otherwise, they are
+    computed on each call.
     """
 
     @override
@@ -330,55 +395,51 @@ class SimpleCSVRecordDiffer(CSVRecordDiffer):
         target: CSVRecord,
         *,
         record_id: str | None = None,
+        extra_target_fields: Iterable[str] | None = None,
         **kwargs,
     ) -> Iterable[CSVDiff]:
         if record_id is None:
             _err_msg: str = "'record_id' MUST be given."
             raise RecordIDMissingError(message=_err_msg)
 
-        yield from self._check_for_field_mismatch(source, target, record_id)
-        yield from self._check_for_extra_tgt_fields(source, target, record_id)
+        # Check for discrepancies in a single pass over the source fields. Most
+        # values match as read, so collect only those that don't and sanitize
+        # these. Values that are not strings, e.g. `None` for missing values,
+        # are never sanitized.
+        tgt_val: Any
+        candidates: list[tuple[str, Any, Any]] = [
+            (column, src_val, tgt_val)
+            for column, src_val in source.items()
+            if (tgt_val := target.get(column, None)) != src_val
+        ]
+        # Return the diffs as a list, not from a generator. This saves a
+        # generator resume per diff, most records have only a few diffs.
+        diffs: list[CSVDiff] = [
+            CSVDiff.of_field_mismatch(
+                record_id=record_id,
+                field=column,
+                source_value=src_val,
+                target_value=tgt_val,
+            )
+            for column, src_val, tgt_val in candidates
+            if (
+                not isinstance(src_val, str)
+                or not isinstance(tgt_val, str)
+                or _sanitize(src_val) != _sanitize(tgt_val)
+            )
+        ]
 
-    @staticmethod
-    def _check_for_extra_tgt_fields(
-        source_fields: Iterable[str],
-        target_fields: Iterable[str],
-        record_id: str,
-    ) -> Iterable[CSVDiff]:
-        extra_fields = set(target_fields).difference(set(source_fields))
-        for extra_field in extra_fields:
-            yield CSVDiff.of_extra_target_field(
+        if extra_target_fields is None:
+            extra_target_fields = target.keys() - source.keys()
+        diffs.extend(
+            CSVDiff.of_extra_target_field(
                 record_id=record_id,
                 field=extra_field,
             )
+            for extra_field in extra_target_fields
+        )
 
-        return ()
-
-    @staticmethod
-    def _check_for_field_mismatch(
-        source: CSVRecord,
-        target: CSVRecord,
-        record_id: str,
-    ) -> Iterable[CSVDiff]:
-        self = SimpleCSVRecordDiffer
-        for column in source:
-            src_val: Any = source[column]
-            tgt_val: Any = target.get(column, None)
-            if self._sanitize_value(src_val) != self._sanitize_value(tgt_val):
-                yield CSVDiff.of_field_mismatch(
-                    record_id=record_id,
-                    field=column,
-                    source_value=src_val,
-                    target_value=tgt_val,
-                )
-        return ()
-
-    @staticmethod
-    def _sanitize_value(value: Any) -> Any:  # noqa: ANN401
-        # FIXME: This should probably only be done for specific columns.
-        if not isinstance(value, str):
-            return value
-        return value.strip().lower()
+        return diffs
 
 
 @frozen
@@ -388,96 +449,166 @@ class CSVReconciler(Reconciler):
     This ``Reconciler`` outsources CSV records comparisons to an instance of
     :class:`CSVRecordDiffer`. It does, however, identify records missing on
     both the source and target datasets natively.
+
+    By default, the records are compared sequentially on the current process.
+    Large datasets can instead be compared on a pool of ``workers`` processes
+    by setting ``workers`` to a value greater than one. In that case, the
+    ``csv_record_differ_factory``, the records and the resulting diffs MUST
+    all be picklable. The source records are handed to the worker processes
+    in chunks of ``chunk_size`` records, and datasets that do not fill a
+    single chunk are still compared on the current process. Either way, the
+    diffs are produced in the same order.
     """
 
-    _source: Iterable[str] = field(
-        alias="source",
-        repr=False,
-        validator=validators.instance_of((Iterable,)),
-    )
-    _target: Iterable[str] = field(
-        alias="target",
-        repr=False,
-        validator=validators.instance_of((Iterable,)),
-    )
+    # Mostly no validators here, the arguments are instead checked once by the
+    # `of` factory method, and only when assertions are enabled. The exception
+    # is `chunk_size`, a size less than one would silently drop every source
+    # record when comparing records on worker processes.
+    _source: Iterable[str] = field(alias="source", repr=False)
+    _target: Iterable[str] = field(alias="target", repr=False)
     _csv_rec_differ_factory: CSVRecordDifferFactory = field(
         alias="csv_record_differ_factory",
         default=SimpleCSVRecordDiffer,
         repr=False,
-        validator=validators.is_callable(),
     )
-    _unresolved_src_records: dict[str, CSVRecord] = field(
-        factory=dict,
-        init=False,
-        repr=False,
-    )
-    _unresolved_tgt_records: dict[str, CSVRecord] = field(
-        factory=dict,
-        init=False,
+    _workers: int = field(alias="workers", default=1, kw_only=True, repr=False)
+    _chunk_size: int = field(
+        alias="chunk_size",
+        default=_PARALLEL_CHUNK_SIZE,
+        kw_only=True,
         repr=False,
+        validator=validators.ge(1),
     )
 
     @override
     def reconcile(self) -> Iterable[CSVDiff]:
-        source: csv.DictReader = csv.DictReader(self._source)
-        target: csv.DictReader = csv.DictReader(self._target)
-
-        src_record: CSVRecord | None
-        tgt_record: CSVRecord | None
-
-        csv_record_differ: Differ[CSVRecord, CSVRecord, str]
-        csv_record_differ = self._csv_rec_differ_factory()
-        for src_record, tgt_record in zip_longest(source, target):
-            if src_record and tgt_record:
-                src_id_column: str = self._get_record_id_column(src_record)
-                tgt_id_column: str = self._get_record_id_column(tgt_record)
-                src_id: str = src_record[src_id_column]
-                tgt_id: str = tgt_record[tgt_id_column]
-
-                if src_id == tgt_id:
-                    yield from csv_record_differ.compare(
-                        source=src_record,
-                        target=tgt_record,
-                        record_id=src_id,
-                    )
-                else:
-                    self._unresolved_src_records[src_id] = src_record
-                    self._unresolved_tgt_records[tgt_id] = tgt_record
-            elif src_record:
-                src_id_column: str = self._get_record_id_column(src_record)
-                src_id: str = src_record[src_id_column]
-
-                if src_id in self._unresolved_tgt_records:
-                    yield from csv_record_differ.compare(
-                        source=src_record,
-                        target=self._unresolved_tgt_records.pop(src_id),
-                        record_id=src_id,
-                    )
-                else:
-                    self._unresolved_src_records[src_id] = src_record
-            elif tgt_record:
-                tgt_id_column = self._get_record_id_column(tgt_record)
-                tgt_id: str = tgt_record[tgt_id_column]
-
-                if tgt_id in self._unresolved_src_records:
-                    yield from csv_record_differ.compare(
-                        source=self._unresolved_src_records.pop(tgt_id),
-                        target=tgt_record,
-                        record_id=tgt_id,
-                    )
-                else:
-                    self._unresolved_tgt_records[tgt_id] = tgt_record
-
-        for src_id in self._unresolved_src_records:
-            yield CSVDiff.of_not_in_target(record_id=src_id)
+        # Index the target records by their IDs and then probe the index with
+        # each source record as it is read. Target records left on the index
+        # once all the source records have been read are missing on the source.
+        tgt_records: dict[str, CSVRecord] = dict(
+            self._read_records(self._target)
+        )
+        records: Iterator[tuple[str, CSVRecord, CSVRecord | None]] = (
+            (src_id, src_record, tgt_records.pop(src_id, None))
+            for src_id, src_record in self._read_records(self._source)
+        )
+        if self._workers > 1:
+            yield from self._diff_records_in_parallel(records)
+        else:
+            yield from _diff_records(self._csv_rec_differ_factory, records)
 
-        for tgt_id in self._unresolved_tgt_records:
+        for tgt_id in tgt_records:
             yield CSVDiff.of_not_in_source(record_id=tgt_id)
 
         return ()
 
+    def _diff_records_in_parallel(
+        self,
+        records: Iterator[tuple[str, CSVRecord, CSVRecord | None]],
+    ) -> Iterator[CSVDiff]:
+        chunks = iter(partial(_take, records, self._chunk_size), [])
+        first_chunk = next(chunks, [])
+        if len(first_chunk) < self._chunk_size:
+            # Too small to be worth starting the worker processes.
+            yield from _diff_records(self._csv_rec_differ_factory, first_chunk)
+            return
+
+        try:
+            from concurrent.futures import ProcessPoolExecutor
+
+            executor = ProcessPoolExecutor(max_workers=self._workers)
+        except (ImportError, NotImplementedError):
+            # No working multiprocessing support on this platform, e.g. no
+            # `sem_open`. Compare the records on the current process instead.
+            yield from _diff_records(
+                self._csv_rec_differ_factory,
+                chain(first_chunk, records),
+            )
+            return
+
+        # Bound the number of chunks in flight so that the source isn't read
+        # into memory all at once. Results are collected in submission order.
+        max_pending: int = 2 * self._workers
+        pending: deque[Future[list[CSVDiff]]] = deque()
+        with executor:
+            for chunk in chain((first_chunk,), chunks):
+                pending.append(
+                    executor.submit(
+                        _diff_records_chunk,
+                        self._csv_rec_differ_factory,
+                        chunk,
+                    )
+                )
+                if len(pending) >= max_pending:
+                    yield from pending.popleft().result()
+            while pending:
+                yield from pending.popleft().result()
+
+    @classmethod
+    def of(
+        cls,
+        source: Iterable[str],
+        target: Iterable[str],
+        csv_record_differ_factory: CSVRecordDifferFactory | None = None,
+        workers: int = 1,
+        chunk_size: int = _PARALLEL_CHUNK_SIZE,
+    ) -> Self:
+        """Create and return an instance of this class.
+
+        :param source: The lines of the source CSV dataset to check for
+            differences against.
+        :param target: The lines of the target CSV dataset to check for
+            differences.
+        :param csv_record_differ_factory: The factory of the
+            ``CSVRecordDiffer`` used to compare the records. When not given
+            or when ``None``, :class:`SimpleCSVRecordDiffer` is used.
+        :param workers: The number of worker processes to compare records on.
+            Defaults to ``1``, i.e. the records are compared on the current
+            process.
+        :param chunk_size: The number of source records handed to a worker
+            process at a time. Only used when ``workers`` is greater than
+            one. MUST be greater than zero. Defaults to ``10_000``.
+
+        :return: An instance of ``CSVReconciler``.
+        """
+        _differ_factory: CSVRecordDifferFactory = (
+            csv_record_differ_factory or SimpleCSVRecordDiffer
+        )
+        assert isinstance(source, Iterable), "'source' MUST be an Iterable."
+        assert isinstance(target, Iterable), "'target' MUST be an Iterable."
+        assert callable(
+            _differ_factory
+        ), "'csv_record_differ_factory' MUST be a callable."
+        assert isinstance(workers, int), "'workers' MUST be an int."
+        assert isinstance(chunk_size, int), "'chunk_size' MUST be an int."
+        return cls(
+            source=source,
+            target=target,
+            csv_record_differ_factory=_differ_factory,
+            workers=workers,
+            chunk_size=chunk_size,
+        )
+
     @staticmethod
-    def _get_record_id_column(record: CSVRecord) -> str:
-        # TODO: This should only be computed once. Consider caching this. But
-        #  separate the IDs for source records and target records.
-        return next(iter(record))
+    def _read_records(
+        csv_file: Iterable[str],
+    ) -> Iterator[tuple[str, CSVRecord]]:
+        # Read the rows as plain lists and only build a record per row from the
+        # header read once, instead of using a `csv.DictReader`. The ID column
+        # is the first one in both the source and target.
+        reader = csv.reader(csv_file)
+        header: tuple[str, ...] = tuple(next(reader, ()))
+        if not header:
+            return
+
+        header_len: int = len(header)
+        for row in reader:
+            if not row:  # Skip blank lines, like `csv.DictReader` does.
+                continue
+            # Like `csv.DictReader`, read missing trailing values as `None`.
+            record: CSVRecord = (
+                dict(zip(header, row, strict=False))
+                if len(row) >= header_len
+                else dict(zip_longest(header, row))
+            )
+            yield row[_RECORD_ID_INDEX], record
@@ -0,0 +1 @@
+# ruff: noqa: D104
@@ -0,0 +1,46 @@
+# ruff: noqa: D100, D102
+from __future__ import annotations
+
+from unittest import TestCase
+from unittest.mock import patch
+
+import click
+import pytest
+
+from credrails.reconciler.cli._utils import EntryPointChoice
+
+
+class TestEntryPointChoice(TestCase):
+    """Tests for the :class:`EntryPointChoice` class."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self._patcher = patch(
+            "credrails.reconciler.cli._utils.list_available_entry_point_names",
+            return_value=("csv-reconciler",),
+        )
+        self._list_names = self._patcher.start()
+        self.addCleanup(self._patcher.stop)
+        self._instance: EntryPointChoice = EntryPointChoice(
+            "credrails.reconciler.cli.reconciler",
+            "auto",
+        )
+
+    def test_choices_are_looked_up_lazily(self) -> None:
+        self._list_names.assert_not_called()
+
+        assert self._instance.choices == ("auto", "csv-reconciler")
+        self._list_names.assert_called_once_with(
+            "credrails.reconciler.cli.reconciler"
+        )
+
+    def test_convert(self) -> None:
+        assert self._instance.convert("auto", None, None) == "auto"
+        assert (
+            self._instance.convert("csv-reconciler", None, None)
+            == "csv-reconciler"
+        )
+
+    def test_convert_with_unknown_values(self) -> None:
+        with pytest.raises(click.BadParameter):
+            self._instance.convert("unknown", None, None)
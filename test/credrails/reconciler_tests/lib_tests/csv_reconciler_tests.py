@@ -0,0 +1,216 @@
+# ruff: noqa: D100, D102
+from __future__ import annotations
+
+from io import StringIO
+from unittest import TestCase
+from unittest.mock import patch
+
+import pytest
+
+from credrails.reconciler.core import Diff
+from credrails.reconciler.lib.csv_reconciler import (
+    CSVDiff,
+    CSVDiffWriter,
+    CSVReconciler,
+    SimpleCSVRecordDiffer,
+    UnsupportedDiffTypeError,
+)
+
+
+class _FakeDiff(Diff[str]):
+    """A :class:`Diff` that is not a :class:`CSVDiff`."""
+
+    @property
+    def expected(self) -> str:
+        return "expected"
+
+    @property
+    def found(self) -> str:
+        return "found"
+
+    @property
+    def kind(self) -> str:
+        return "Fake"
+
+
+class TestCSVDiffWriter(TestCase):
+    """Tests for the :class:`CSVDiffWriter` class."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self._writable: StringIO = StringIO()
+        self._instance: CSVDiffWriter = CSVDiffWriter(writable=self._writable)
+
+    def test_write(self) -> None:
+        self._instance.write(
+            (
+                CSVDiff.of_field_mismatch(
+                    record_id="002",
+                    field="Amount",
+                    source_value="200.50",
+                    target_value="200.5",
+                ),
+                CSVDiff.of_extra_target_field(record_id="001", field="Extra"),
+                CSVDiff.of_not_in_source(record_id="004"),
+                CSVDiff.of_not_in_target(record_id="003"),
+            )
+        )
+
+        assert self._writable.getvalue() == (
+            "_kind,_record_id,_field,_source_value,_target_value\r\n"
+            "Field Discrepancy,002,Amount,200.50,200.5\r\n"
+            "Extra Target Column,001,Extra,,\r\n"
+            "Missing in Source,004,,,\r\n"
+            "Missing in Target,003,,,\r\n"
+        )
+
+    def test_write_with_unsupported_diffs(self) -> None:
+        with pytest.raises(UnsupportedDiffTypeError):
+            self._instance.write((_FakeDiff(),))
+
+
+class TestSimpleCSVRecordDiffer(TestCase):
+    """Tests for the :class:`SimpleCSVRecordDiffer` class."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self._instance: SimpleCSVRecordDiffer = SimpleCSVRecordDiffer()
+
+    def test_compare(self) -> None:
+        diffs = self._instance.compare(
+            {"ID": "1", "Name": " Jane ", "Amount": "200.50"},
+            {"ID": "1", "Name": "jane", "Amount": "200.5", "Extra": "x"},
+            record_id="1",
+        )
+
+        assert list(diffs) == [
+            CSVDiff.of_field_mismatch(
+                record_id="1",
+                field="Amount",
+                source_value="200.50",
+                target_value="200.5",
+            ),
+            CSVDiff.of_extra_target_field(record_id="1", field="Extra"),
+        ]
+
+    def test_compare_with_sanitized_equal_values(self) -> None:
+        diffs = self._instance.compare(
+            {"ID": "1", "Name": " Jane "},
+            {"ID": "1", "Name": "jane"},
+            record_id="1",
+        )
+
+        assert list(diffs) == []
+
+
+class TestCSVReconciler(TestCase):
+    """Tests for the :class:`CSVReconciler` class."""
+
+    def test_reconcile(self) -> None:
+        source = StringIO(
+            "ID,Name,Amount\n"
+            "001,John Doe,100.00\n"
+            "\n"
+            "002,Jane Smith,200.50\n"
+            "003,Robert Brown,300.75\n"
+        )
+        target = StringIO(
+            "ID,Name,Amount,Extra\n"
+            "001,John Doe,100.00,x\n"
+            "004,Emily White,400.90,y\n"
+            "002, jane smith ,200.5,z\n"
+        )
+        instance = CSVReconciler(source=source, target=target)
+
+        diffs = set(instance.reconcile())
+
+        assert diffs == {
+            CSVDiff.of_extra_target_field(record_id="001", field="Extra"),
+            CSVDiff.of_extra_target_field(record_id="002", field="Extra"),
+            CSVDiff.of_field_mismatch(
+                record_id="002",
+                field="Amount",
+                source_value="200.50",
+                target_value="200.5",
+            ),
+            CSVDiff.of_not_in_source(record_id="004"),
+            CSVDiff.of_not_in_target(record_id="003"),
+        }
+
+    def test_reconcile_with_empty_inputs(self) -> None:
+        instance = CSVReconciler(source=StringIO(), target=StringIO())
+
+        assert list(instance.reconcile()) == []
+
+    def test_reconcile_on_worker_processes(self) -> None:
+        source, target = self._make_large_inputs()
+
+        sequential = CSVReconciler(
+            source=StringIO(source),
+            target=StringIO(target),
+        )
+        parallel = CSVReconciler(
+            source=StringIO(source),
+            target=StringIO(target),
+            workers=2,
+            chunk_size=10,
+        )
+
+        assert list(parallel.reconcile()) == list(sequential.reconcile())
+
+    def test_reconcile_without_multiprocessing_support(self) -> None:
+        source, target = self._make_large_inputs()
+        sequential = CSVReconciler(
+            source=StringIO(source),
+            target=StringIO(target),
+        )
+        parallel = CSVReconciler(
+            source=StringIO(source),
+            target=StringIO(target),
+            workers=2,
+            chunk_size=10,
+        )
+
+        with patch(
+            "concurrent.futures.ProcessPoolExecutor",
+            side_effect=NotImplementedError,
+        ):
+            diffs = list(parallel.reconcile())
+
+        assert diffs == list(sequential.reconcile())
+
+    def test_of(self) -> None:
+        source, target = self._make_large_inputs()
+        source_io, target_io = StringIO(source), StringIO(target)
+
+        instance = CSVReconciler.of(source_io, target_io)
+
+        assert instance == CSVReconciler(
+            source=source_io,
+            target=target_io,
+            csv_record_differ_factory=SimpleCSVRecordDiffer,
+        )
+        assert list(instance.reconcile()) == list(
+            CSVReconciler(
+                source=StringIO(source),
+                target=StringIO(target),
+            ).reconcile()
+        )
+
+    def test_chunk_size_must_be_greater_than_zero(self) -> None:
+        with pytest.raises(ValueError, match="chunk_size"):
+            CSVReconciler(
+                source=StringIO(),
+                target=StringIO(),
+                workers=2,
+                chunk_size=0,
+            )
+
+    @staticmethod
+    def _make_large_inputs() -> tuple[str, str]:
+        rows: list[str] = [
+            f"{index},Name {index},{index}.00\n" for index in range(41)
+        ]
+        source: str = "ID,Name,Amount\n" + "".join(rows)
+        target: str = "ID,Name,Amount\n" + "".join(reversed(rows[1:]))
+        return source, target.replace(".00", ".50")